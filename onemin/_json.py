@@ -0,0 +1,28 @@
+"""JSON helpers - uses orjson when installed, stdlib json otherwise."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional, see the "fast" extra
+    orjson = None
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using str() for unsupported types."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        default=str,
+        ensure_ascii=False,
+    ).encode()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
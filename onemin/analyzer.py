@@ -1,12 +1,35 @@
 """Video analysis module - extract frames and transcribe audio."""
 
+import itertools
+import os
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from .config import get_settings
+import numpy as np
+
+from .config import Settings, get_settings
+
+# Maximum transcript length sent to AI providers
+PROMPT_TRANSCRIPT_CHARS = 8000
+
+# Extracted frames are scaled to YouTube thumbnail size (width, height)
+FRAME_SIZE = (1280, 720)
+_FRAME_SCALE = f"scale={FRAME_SIZE[0]}:{FRAME_SIZE[1]}:flags=lanczos"
+
+# Longest video (seconds) for which frames are extracted in one decoding pass
+SINGLE_PASS_MAX_DURATION = 120.0
+
+# Loaded Whisper models, keyed by (model_name, device, device_index, compute_type)
+_WHISPER_CACHE: dict[tuple, Any] = {}
+_WHISPER_LOCK = threading.Lock()
+# Round-robin counter for spreading transcriptions across GPUs
+_whisper_turn = itertools.count()
 
 
 @dataclass
@@ -31,15 +54,33 @@ class AnalysisResult:
     transcript: str  # Full transcript
     transcript_segments: list[dict]  # Timestamped segments
 
+    @cached_property
+    def prompt_transcript(self) -> str:
+        """Transcript limited to PROMPT_TRANSCRIPT_CHARS for AI prompts."""
+        if len(self.transcript) <= PROMPT_TRANSCRIPT_CHARS:
+            return self.transcript
+        return self.transcript[:PROMPT_TRANSCRIPT_CHARS]
+
 
 def get_video_info(video_path: Path) -> VideoInfo:
-    """Get video metadata using ffprobe."""
+    """Get video metadata using ffprobe.
+
+    Results are cached per file, keyed by modification time and size.
+    """
+    stat = video_path.stat()
+    return _probe_video(video_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _probe_video(video_path: Path, mtime_ns: int, size: int) -> VideoInfo:
+    """Run ffprobe on a video. mtime_ns and size only serve as cache keys."""
+    # Only ask for the first video stream and the fields we actually read
     cmd = [
         "ffprobe",
         "-v", "quiet",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=width,height,r_frame_rate,codec_name:format=duration,size",
         "-print_format", "json",
-        "-show_format",
-        "-show_streams",
         str(video_path),
     ]
 
@@ -47,16 +88,12 @@ def get_video_info(video_path: Path) -> VideoInfo:
     import json
     data = json.loads(result.stdout)
 
-    # Find video stream
-    video_stream = next(
-        (s for s in data["streams"] if s["codec_type"] == "video"),
-        None
-    )
-
-    if not video_stream:
+    streams = data.get("streams")
+    if not streams:
         raise ValueError(f"No video stream found in {video_path}")
 
-    format_info = data["format"]
+    video_stream = streams[0]
+    format_info = data.get("format", {})
 
     # Parse frame rate (can be "30/1" or "29.97")
     fps_str = video_stream.get("r_frame_rate", "30/1")
@@ -77,108 +114,257 @@ def get_video_info(video_path: Path) -> VideoInfo:
     )
 
 
+def _extract_frames_at(
+    video_path: Path,
+    output_dir: Path,
+    timestamps: list[float],
+) -> list[Path]:
+    """Extract one frame per timestamp, running the ffmpeg calls in parallel."""
+    frames = [output_dir / f"frame_{i:03d}.jpg" for i in range(len(timestamps))]
+    # -ss before -i seeks the container to the nearest keyframe instead of
+    # decoding from the start of the file
+    cmds = [
+        [
+            "ffmpeg",
+            "-y",  # Overwrite
+            "-ss", str(timestamp),
+            "-i", str(video_path),
+            "-vf", _FRAME_SCALE,
+            "-frames:v", "1",
+            "-q:v", "2",  # High quality JPEG
+            str(output_path),
+        ]
+        for timestamp, output_path in zip(timestamps, frames)
+    ]
+
+    max_workers = min(len(cmds), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(
+            lambda cmd: subprocess.run(cmd, capture_output=True, check=True),
+            cmds,
+        ))
+
+    return frames
+
+
 def extract_frames(
     video_path: Path,
     output_dir: Path,
     num_frames: Optional[int] = None,
+    video_info: Optional[VideoInfo] = None,
+    settings: Optional[Settings] = None,
 ) -> list[Path]:
     """Extract key frames from video.
 
-    Extracts frames at even intervals throughout the video.
+    Extracts frames at even intervals throughout the video, scaled to
+    FRAME_SIZE so thumbnails need no resize. Videos up to
+    SINGLE_PASS_MAX_DURATION use a single ffmpeg invocation; longer ones
+    seek to each timestamp in parallel. Pass video_info if it is already
+    known to skip probing.
     """
-    settings = get_settings()
+    settings = settings or get_settings()
     num_frames = num_frames or settings.max_frames
 
-    video_info = get_video_info(video_path)
+    video_info = video_info or get_video_info(video_path)
     duration = video_info.duration
 
     if duration <= 0:
         raise ValueError(f"Invalid video duration: {duration}")
 
     output_dir.mkdir(parents=True, exist_ok=True)
-    frames = []
 
-    # Calculate timestamps for even distribution
-    # Skip first and last 5% to avoid intros/outros
-    start_time = duration * 0.05
-    end_time = duration * 0.95
-    interval = (end_time - start_time) / (num_frames - 1) if num_frames > 1 else 0
+    # Clear frames left over from a previous run so only ours are collected
+    for stale in output_dir.glob("frame_*.jpg"):
+        stale.unlink()
+
+    # Even distribution, skipping first and last 5% to avoid intros/outros
+    timestamps = np.linspace(duration * 0.05, duration * 0.95, num_frames)
+    start_time = float(timestamps[0])
 
-    for i in range(num_frames):
-        timestamp = start_time + (i * interval)
-        output_path = output_dir / f"frame_{i:03d}.jpg"
+    frames: list[Path] = []
 
+    # The single pass decodes every frame between the first and last
+    # timestamp, so it only beats per-timestamp seeks on short videos
+    if duration <= SINGLE_PASS_MAX_DURATION:
+        # Seek to the first timestamp, then select exactly the frames at the
+        # remaining ones (frame numbers count from the seek point)
+        frame_nums = np.unique(np.round((timestamps - start_time) * video_info.fps).astype(int))
+        select = "+".join(f"eq(n,{n})" for n in frame_nums)
         cmd = [
             "ffmpeg",
             "-y",  # Overwrite
-            "-ss", str(timestamp),
+            "-ss", str(start_time),
             "-i", str(video_path),
-            "-vframes", "1",
+            "-vf", f"select='{select}',{_FRAME_SCALE}",
+            "-vsync", "vfr",
+            "-frames:v", str(len(frame_nums)),
             "-q:v", "2",  # High quality JPEG
-            str(output_path),
+            "-start_number", "0",
+            str(output_dir / "frame_%03d.jpg"),
         ]
 
-        subprocess.run(cmd, capture_output=True, check=True)
-        frames.append(output_path)
+        try:
+            subprocess.run(cmd, capture_output=True, check=True)
+            frames = sorted(output_dir.glob("frame_*.jpg"))
+        except subprocess.CalledProcessError:
+            frames = []
+
+    if len(frames) < num_frames:
+        # Long video or incomplete single pass: seek each timestamp individually
+        frames = _extract_frames_at(video_path, output_dir, timestamps.tolist())
 
     return frames
 
 
-def extract_audio(video_path: Path, output_path: Path) -> Path:
-    """Extract audio from video as WAV for transcription."""
+def decode_audio(video_path: Path) -> np.ndarray:
+    """Decode the audio track to 16kHz mono float32 samples for Whisper.
+
+    ffmpeg writes raw PCM to stdout, so no intermediate WAV file is needed.
+    """
     cmd = [
         "ffmpeg",
-        "-y",
         "-i", str(video_path),
         "-vn",  # No video
+        "-f", "s16le",
         "-acodec", "pcm_s16le",
         "-ar", "16000",  # 16kHz for Whisper
         "-ac", "1",  # Mono
-        str(output_path),
+        "-",
     ]
 
-    subprocess.run(cmd, capture_output=True, check=True)
-    return output_path
+    result = subprocess.run(cmd, capture_output=True, check=True)
+    return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
+
+
+def _cuda_device_count() -> int:
+    """Get the number of CUDA devices visible to CTranslate2."""
+    try:
+        import ctranslate2
+    except ImportError:
+        return 0
+    return ctranslate2.get_cuda_device_count()
+
 
+def _detect_whisper_device() -> str:
+    """Pick the best device CTranslate2 can use on this machine."""
+    if _cuda_device_count() > 0:
+        return "cuda"
+    return "cpu"
 
-def transcribe_audio(audio_path: Path) -> tuple[str, list[dict]]:
-    """Transcribe audio using Whisper.
+
+def whisper_device_count(settings: Optional[Settings] = None) -> int:
+    """Get the number of devices transcriptions are spread across."""
+    settings = settings or get_settings()
+    device = settings.transcribe_device or _detect_whisper_device()
+    if device == "cuda":
+        return max(_cuda_device_count(), 1)
+    return 1
+
+
+def _get_whisper_model(
+    model_name: str,
+    device: Optional[str] = None,
+    compute_type: str = "auto",
+) -> Any:
+    """Get a loaded Whisper model, loading it on first use.
+
+    Models are kept for the lifetime of the process so that batches and
+    the watch-folder daemon only pay the load cost once. On multi-GPU
+    machines one model is loaded per GPU and calls rotate between them.
+    """
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError:
+        raise ImportError(
+            "faster-whisper not installed. Run: pip install faster-whisper"
+        )
+
+    device = device or _detect_whisper_device()
+    if compute_type == "auto":
+        # float16 halves memory traffic on GPU; int8 is fastest on CPU
+        compute_type = "float16" if device == "cuda" else "int8"
+
+    device_count = max(_cuda_device_count(), 1) if device == "cuda" else 1
+
+    with _WHISPER_LOCK:
+        device_index = next(_whisper_turn) % device_count
+        key = (model_name, device, device_index, compute_type)
+        model = _WHISPER_CACHE.get(key)
+        if model is None:
+            model = WhisperModel(
+                model_name,
+                device=device,
+                device_index=device_index,
+                compute_type=compute_type,
+            )
+            _WHISPER_CACHE[key] = model
+
+    return model
+
+
+def transcribe_audio(
+    audio: np.ndarray,
+    settings: Optional[Settings] = None,
+) -> tuple[str, list[dict]]:
+    """Transcribe audio using faster-whisper (CTranslate2).
+
+    Args:
+        audio: 16kHz mono float32 samples, as returned by decode_audio
+        settings: Settings to use. Uses the global settings if None.
 
     Returns:
         Tuple of (full_transcript, segments)
         where segments is a list of {"start": float, "end": float, "text": str}
     """
-    settings = get_settings()
+    settings = settings or get_settings()
 
     try:
-        import whisper
+        from faster_whisper import BatchedInferencePipeline
     except ImportError:
         raise ImportError(
-            "whisper not installed. Run: pip install openai-whisper"
+            "faster-whisper not installed. Run: pip install faster-whisper"
         )
 
-    model = whisper.load_model(settings.transcribe_model)
-    result = model.transcribe(str(audio_path))
+    model = _get_whisper_model(
+        settings.transcribe_model,
+        device=settings.transcribe_device,
+        compute_type=settings.transcribe_compute_type,
+    )
+
+    # VAD splits the audio into speech chunks (<=30s) which are decoded in batches
+    pipeline = BatchedInferencePipeline(model=model)
+    result, _info = pipeline.transcribe(
+        audio,
+        batch_size=settings.transcribe_batch_size,
+        beam_size=1,
+        vad_filter=True,
+    )
 
-    full_text = result["text"].strip()
+    # faster-whisper yields segments lazily; materialize them here
     segments = [
         {
-            "start": seg["start"],
-            "end": seg["end"],
-            "text": seg["text"].strip(),
+            "start": seg.start,
+            "end": seg.end,
+            "text": seg.text.strip(),
         }
-        for seg in result["segments"]
+        for seg in result
     ]
+    full_text = " ".join(seg["text"] for seg in segments).strip()
 
     return full_text, segments
 
 
-def analyze_video(video_path: Path, work_dir: Optional[Path] = None) -> AnalysisResult:
+def analyze_video(
+    video_path: Path,
+    work_dir: Optional[Path] = None,
+    settings: Optional[Settings] = None,
+) -> AnalysisResult:
     """Full video analysis: extract info, frames, and transcript.
 
     Args:
         video_path: Path to the video file
         work_dir: Working directory for temporary files. If None, uses temp dir.
+        settings: Settings to use. Uses the global settings if None.
 
     Returns:
         AnalysisResult with video info, frames, and transcript
@@ -194,17 +380,26 @@ def analyze_video(video_path: Path, work_dir: Optional[Path] = None) -> Analysis
     else:
         work_dir.mkdir(parents=True, exist_ok=True)
 
+    settings = settings or get_settings()
+
     # Get video info
     video_info = get_video_info(video_path)
 
-    # Extract frames
+    # Extract frames and audio concurrently - they are independent ffmpeg passes
     frames_dir = work_dir / "frames"
-    frames = extract_frames(video_path, frames_dir)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        frames_future = executor.submit(
+            extract_frames,
+            video_path,
+            frames_dir,
+            video_info=video_info,
+            settings=settings,
+        )
+        audio_future = executor.submit(decode_audio, video_path)
 
-    # Extract and transcribe audio
-    audio_path = work_dir / "audio.wav"
-    extract_audio(video_path, audio_path)
-    transcript, segments = transcribe_audio(audio_path)
+        # Transcription only needs the audio, so it overlaps frame extraction
+        transcript, segments = transcribe_audio(audio_future.result(), settings)
+        frames = frames_future.result()
 
     return AnalysisResult(
         video_info=video_info,
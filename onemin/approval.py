@@ -1,16 +1,60 @@
 """Telegram-based approval workflow."""
 
-import json
+import copy
+import os
+import secrets
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import httpx
 
-from .config import get_settings, get_config_dir
+from . import _json
+from .config import Settings, get_settings, get_config_dir
 from .metadata import VideoMetadata
 from .analyzer import AnalysisResult
 
+# In-memory copy of pending_requests.json, shared by readers and writers
+_cache: Optional[dict[str, dict]] = None
+_cache_mtime: Optional[int] = None
+_dirty = False
+_lock = threading.RLock()
+
+# Telegram approval message; analysis_block is empty when there is no analysis
+_TG_TEMPLATE = """🎬 **New Video Ready for Upload**
+
+**Title:** {title}
+
+**Description:**
+{description}
+
+**Tags:** {tags}
+
+**Video:** `{video_name}`
+{analysis_block}
+**Request ID:** `{request_id}`
+
+Reply with:
+✅ `approve {request_id}` to upload
+❌ `reject {request_id}` to cancel
+✏️ `edit {request_id} title <new title>` to change title
+"""
+
+_TG_ANALYSIS_TEMPLATE = """
+**Duration:** {minutes:.1f} minutes
+**Resolution:** {width}x{height}
+"""
+
+# Shared Telegram API client, created on first use
+_tg_client: Optional[httpx.Client] = None
+_tg_client_lock = threading.Lock()
+
+# Background pool for fire-and-forget notifications
+_notify_pool = ThreadPoolExecutor(max_workers=2)
+
 
 @dataclass
 class ApprovalRequest:
@@ -29,20 +73,72 @@ def get_pending_requests_file() -> Path:
     return get_config_dir() / "pending_requests.json"
 
 
-def load_pending_requests() -> dict[str, dict]:
-    """Load pending requests from disk."""
+def _get_cache() -> dict[str, dict]:
+    """Get the in-memory requests, re-reading the file only if it changed."""
+    global _cache, _cache_mtime
     path = get_pending_requests_file()
-    if path.exists():
-        with open(path) as f:
-            return json.load(f)
-    return {}
+
+    try:
+        mtime: Optional[int] = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    # Unflushed changes win over the file on disk
+    if _cache is None or (mtime != _cache_mtime and not _dirty):
+        if mtime is None:
+            _cache = {}
+        else:
+            _cache = _json.loads(path.read_bytes())
+        _cache_mtime = mtime
+
+    return _cache
+
+
+def _mark_dirty() -> None:
+    """Record a change to the cache and write it out."""
+    global _dirty
+    _dirty = True
+    flush_pending_requests()
+
+
+def load_pending_requests() -> dict[str, dict]:
+    """Load pending requests from disk.
+
+    Returns a deep copy, so changes only persist via save_pending_requests.
+    """
+    with _lock:
+        return copy.deepcopy(_get_cache())
 
 
 def save_pending_requests(requests: dict[str, dict]) -> None:
     """Save pending requests to disk."""
+    global _cache, _cache_mtime, _dirty
     path = get_pending_requests_file()
-    with open(path, "w") as f:
-        json.dump(requests, f, indent=2, default=str)
+    with _lock:
+        # Encode up front so the file is written in a single call
+        payload = _json.dumps(requests, indent=True)
+
+        # Write to a temp file and swap it in, so a crash never leaves a
+        # truncated queue behind
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+        # Keep our own copy so later changes by the caller don't leak in
+        if requests is not _cache:
+            _cache = copy.deepcopy(requests)
+        _cache_mtime = path.stat().st_mtime_ns
+        _dirty = False
+
+
+def flush_pending_requests() -> None:
+    """Write cached request changes to disk, if there are any."""
+    with _lock:
+        if _dirty and _cache is not None:
+            save_pending_requests(_cache)
 
 
 def create_approval_request(
@@ -51,10 +147,7 @@ def create_approval_request(
     thumbnail_path: Path,
 ) -> ApprovalRequest:
     """Create a new approval request."""
-    import uuid
-    from datetime import datetime
-
-    request_id = str(uuid.uuid4())[:8]
+    request_id = secrets.token_hex(4)
 
     request = ApprovalRequest(
         request_id=request_id,
@@ -65,32 +158,49 @@ def create_approval_request(
     )
 
     # Save to pending requests
-    requests = load_pending_requests()
-    requests[request_id] = {
-        "request_id": request_id,
-        "video_path": str(video_path),
-        "title": metadata.title,
-        "description": metadata.description,
-        "tags": metadata.tags,
-        "category_id": metadata.category_id,
-        "thumbnail_path": str(thumbnail_path),
-        "created_at": request.created_at,
-        "status": "pending",
-    }
-    save_pending_requests(requests)
+    with _lock:
+        _get_cache()[request_id] = {
+            "request_id": request_id,
+            "video_path": str(video_path),
+            "title": metadata.title,
+            "description": metadata.description,
+            "tags": list(metadata.tags),
+            "category_id": metadata.category_id,
+            "thumbnail_path": str(thumbnail_path),
+            "created_at": request.created_at,
+            "status": "pending",
+        }
+        _mark_dirty()
 
     return request
 
 
+def _get_tg_client() -> httpx.Client:
+    """Get the shared Telegram HTTP client, keeping connections alive between calls."""
+    global _tg_client
+    with _tg_client_lock:
+        if _tg_client is None:
+            # Client ignores limits= when given a transport, so set them there
+            _tg_client = httpx.Client(
+                timeout=30,
+                transport=httpx.HTTPTransport(
+                    retries=2,
+                    limits=httpx.Limits(max_keepalive_connections=4),
+                ),
+            )
+    return _tg_client
+
+
 def send_telegram_approval(
     request: ApprovalRequest,
     analysis: Optional[AnalysisResult] = None,
+    settings: Optional[Settings] = None,
 ) -> bool:
     """Send approval request to Telegram.
 
     Returns True if message was sent successfully.
     """
-    settings = get_settings()
+    settings = settings or get_settings()
 
     if not settings.telegram_bot_token or not settings.telegram_chat_id:
         print("Telegram not configured. Skipping approval notification.")
@@ -100,89 +210,122 @@ def send_telegram_approval(
     chat_id = settings.telegram_chat_id
 
     # Format message
-    message = f"""🎬 **New Video Ready for Upload**
+    metadata = request.metadata
+    description = metadata.description
+    if len(description) > 500:
+        description = description[:500] + "..."
+    tags = ", ".join(metadata.tags[:5])
+    if len(metadata.tags) > 5:
+        tags += "..."
+
+    analysis_block = ""
+    if analysis:
+        analysis_block = _TG_ANALYSIS_TEMPLATE.format(
+            minutes=analysis.video_info.duration / 60,
+            width=analysis.video_info.width,
+            height=analysis.video_info.height,
+        )
 
-**Title:** {request.metadata.title}
+    message = _TG_TEMPLATE.format_map({
+        "title": metadata.title,
+        "description": description,
+        "tags": tags,
+        "video_name": request.video_path.name,
+        "analysis_block": analysis_block,
+        "request_id": request.request_id,
+    })
 
-**Description:**
-{request.metadata.description[:500]}{'...' if len(request.metadata.description) > 500 else ''}
+    # The message and thumbnail are independent requests, so send the
+    # thumbnail on a worker thread while the message goes out. Either may
+    # reach the chat first; the caption names the request ID.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if request.thumbnail_path.exists():
+            executor.submit(_send_thumbnail, bot_token, chat_id, request)
+        sent = _send_message(bot_token, chat_id, message)
 
-**Tags:** {', '.join(request.metadata.tags[:5])}{'...' if len(request.metadata.tags) > 5 else ''}
+    return sent
 
-**Video:** `{request.video_path.name}`
-"""
 
-    if analysis:
-        message += f"""
-**Duration:** {analysis.video_info.duration / 60:.1f} minutes
-**Resolution:** {analysis.video_info.width}x{analysis.video_info.height}
-"""
+def send_telegram_approval_async(
+    request: ApprovalRequest,
+    analysis: Optional[AnalysisResult] = None,
+    settings: Optional[Settings] = None,
+) -> Future:
+    """Send approval request to Telegram in the background.
 
-    message += f"""
-**Request ID:** `{request.request_id}`
+    Returns a Future resolving to send_telegram_approval's result.
+    """
+    return _notify_pool.submit(send_telegram_approval, request, analysis, settings)
 
-Reply with:
-✅ `approve {request.request_id}` to upload
-❌ `reject {request.request_id}` to cancel
-✏️ `edit {request.request_id} title <new title>` to change title
-"""
 
-    # Send message
+def _send_message(bot_token: str, chat_id: str, message: str) -> bool:
+    """Send a Markdown message to Telegram. Returns True on success."""
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-    payload = {
+    # Encode once ourselves (orjson when available) and post the raw bytes
+    payload = _json.dumps({
         "chat_id": chat_id,
         "text": message,
         "parse_mode": "Markdown",
-    }
+    })
 
     try:
-        response = httpx.post(url, json=payload, timeout=30)
+        response = _get_tg_client().post(
+            url,
+            content=payload,
+            headers={"Content-Type": "application/json"},
+        )
         response.raise_for_status()
     except Exception as e:
         print(f"Failed to send Telegram message: {e}")
         return False
 
-    # Send thumbnail
-    if request.thumbnail_path.exists():
-        url = f"https://api.telegram.org/bot{bot_token}/sendPhoto"
-        with open(request.thumbnail_path, "rb") as f:
-            files = {"photo": f}
-            data = {
-                "chat_id": chat_id,
-                "caption": f"Thumbnail preview for {request.request_id}",
-            }
-            try:
-                response = httpx.post(url, data=data, files=files, timeout=60)
-            except Exception as e:
-                print(f"Failed to send thumbnail: {e}")
-
     return True
 
 
+def _send_thumbnail(bot_token: str, chat_id: str, request: ApprovalRequest) -> None:
+    """Send the thumbnail preview for a request to Telegram."""
+    url = f"https://api.telegram.org/bot{bot_token}/sendPhoto"
+    path = request.thumbnail_path
+    mime = "image/png" if path.suffix.lower() == ".png" else "image/jpeg"
+
+    data = {
+        "chat_id": chat_id,
+        "caption": f"Thumbnail preview for {request.request_id}",
+    }
+    try:
+        # Read once so httpx can send a sized body instead of streaming the file
+        files = {"photo": (path.name, path.read_bytes(), mime)}
+        _get_tg_client().post(url, data=data, files=files, timeout=60)
+    except Exception as e:
+        print(f"Failed to send thumbnail: {e}")
+
+
 def approve_request(request_id: str) -> Optional[dict]:
     """Mark a request as approved and return its data."""
-    requests = load_pending_requests()
+    with _lock:
+        requests = _get_cache()
 
-    if request_id not in requests:
-        return None
+        if request_id not in requests:
+            return None
 
-    requests[request_id]["status"] = "approved"
-    save_pending_requests(requests)
+        requests[request_id]["status"] = "approved"
+        _mark_dirty()
 
-    return requests[request_id]
+        return copy.deepcopy(requests[request_id])
 
 
 def reject_request(request_id: str) -> Optional[dict]:
     """Mark a request as rejected."""
-    requests = load_pending_requests()
+    with _lock:
+        requests = _get_cache()
 
-    if request_id not in requests:
-        return None
+        if request_id not in requests:
+            return None
 
-    requests[request_id]["status"] = "rejected"
-    save_pending_requests(requests)
+        requests[request_id]["status"] = "rejected"
+        _mark_dirty()
 
-    return requests[request_id]
+        return copy.deepcopy(requests[request_id])
 
 
 def update_request_metadata(
@@ -192,30 +335,33 @@ def update_request_metadata(
     tags: Optional[list[str]] = None,
 ) -> Optional[dict]:
     """Update metadata for a pending request."""
-    requests = load_pending_requests()
+    with _lock:
+        requests = _get_cache()
 
-    if request_id not in requests:
-        return None
+        if request_id not in requests:
+            return None
 
-    if title:
-        requests[request_id]["title"] = title
-    if description:
-        requests[request_id]["description"] = description
-    if tags:
-        requests[request_id]["tags"] = tags
+        if title:
+            requests[request_id]["title"] = title
+        if description:
+            requests[request_id]["description"] = description
+        if tags:
+            requests[request_id]["tags"] = list(tags)
 
-    save_pending_requests(requests)
+        _mark_dirty()
 
-    return requests[request_id]
+        return copy.deepcopy(requests[request_id])
 
 
 def get_request(request_id: str) -> Optional[dict]:
     """Get a request by ID."""
-    requests = load_pending_requests()
-    return requests.get(request_id)
+    with _lock:
+        request = _get_cache().get(request_id)
+        return copy.deepcopy(request) if request is not None else None
 
 
 def list_pending() -> list[dict]:
     """List all pending requests."""
-    requests = load_pending_requests()
-    return [r for r in requests.values() if r.get("status") == "pending"]
+    with _lock:
+        requests = _get_cache()
+        return [copy.deepcopy(r) for r in requests.values() if r.get("status") == "pending"]
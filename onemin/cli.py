@@ -1,27 +1,42 @@
 """CLI interface for 1MinAutoYT."""
 
 import sys
+from functools import cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(
     name="onemin",
     help="Upload YouTube videos in one minute. Automated metadata, thumbnails, and publishing.",
     add_completion=False,
 )
-console = Console()
+
+# Table styles for request statuses
+_STATUS_STYLE = {
+    "pending": "yellow",
+    "approved": "green",
+    "rejected": "red",
+}
+
+
+@cache
+def _console() -> "Console":
+    """Get the shared console, importing rich only when something is printed."""
+    from rich.console import Console
+
+    return Console()
 
 
 def print_banner():
     """Print the app banner."""
-    console.print(Panel.fit(
+    from rich.panel import Panel
+
+    _console().print(Panel.fit(
         "[bold cyan]OneMin[/bold cyan]\n"
         "[dim]Upload YouTube videos in one minute[/dim]",
         border_style="cyan",
@@ -36,6 +51,9 @@ def config(
     show: bool = typer.Option(False, "--show", "-s", help="Show current configuration"),
 ):
     """Configure 1MinAutoYT settings."""
+    from rich.prompt import Prompt
+    from rich.table import Table
+
     from .config import get_settings, reload_settings
 
     settings = get_settings()
@@ -53,13 +71,16 @@ def config(
         table.add_row("Telegram Configured", "Yes" if settings.telegram_bot_token else "No")
         table.add_row("YouTube API Configured", "Yes" if settings.youtube_client_id else "No")
 
-        console.print(table)
+        from .thumbnail import pillow_flavor
+        table.add_row("Image Library", pillow_flavor())
+
+        _console().print(table)
         return
 
     # Interactive config if no options provided
     if not any([watch_folder, channel, privacy]):
         print_banner()
-        console.print("\n[bold]Configuration Setup[/bold]\n")
+        _console().print("\n[bold]Configuration Setup[/bold]\n")
 
         watch_folder = Prompt.ask(
             "Watch folder path",
@@ -101,7 +122,7 @@ def config(
         settings.default_privacy = privacy
 
     settings.save()
-    console.print("[green]✓ Configuration saved![/green]")
+    _console().print("[green]✓ Configuration saved![/green]")
 
 
 @app.command()
@@ -110,18 +131,25 @@ def watch(
     process_existing: bool = typer.Option(False, "--existing", "-e", help="Process existing videos first"),
 ):
     """Watch folder for new videos and process automatically."""
-    from .watcher import watch_folder as start_watching, process_existing_videos
-    from .pipeline import process_video
+    from .watcher import watch_folder as start_watching, find_existing_videos
+    from .pipeline import process_video, process_videos
+    from .analyzer import whisper_device_count
 
     print_banner()
 
+    # At least one concurrent video per GPU so every device stays busy
+    max_workers = max(2, whisper_device_count())
+
     if process_existing:
-        console.print("[yellow]Processing existing videos...[/yellow]")
-        count = process_existing_videos(process_video, folder)
-        console.print(f"[green]Processed {count} existing videos[/green]")
+        _console().print("[yellow]Processing existing videos...[/yellow]")
+        videos = find_existing_videos(folder)
+        results = process_videos(videos, max_workers=max_workers)
+        _console().print(
+            f"[green]Processed {len(results)} of {len(videos)} existing videos[/green]"
+        )
 
     folder_path = Path(folder).expanduser() if folder else None
-    start_watching(process_video, folder_path, blocking=True)
+    start_watching(process_video, folder_path, blocking=True, max_workers=max_workers)
 
 
 @app.command()
@@ -142,7 +170,7 @@ def upload(
 
     video_path = Path(video).expanduser()
     if not video_path.exists():
-        console.print(f"[red]Error: Video not found: {video}[/red]")
+        _console().print(f"[red]Error: Video not found: {video}[/red]")
         raise typer.Exit(1)
 
     options = ProcessOptions(
@@ -164,21 +192,23 @@ def analyze(
     output: Optional[str] = typer.Option(None, "--output", "-o", help="Output JSON file"),
 ):
     """Analyze a video and generate metadata (no upload)."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from . import _json
     from .analyzer import analyze_video
     from .metadata import generate_metadata
-    import json
 
     print_banner()
 
     video_path = Path(video).expanduser()
     if not video_path.exists():
-        console.print(f"[red]Error: Video not found: {video}[/red]")
+        _console().print(f"[red]Error: Video not found: {video}[/red]")
         raise typer.Exit(1)
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console,
+        console=_console(),
     ) as progress:
         # Analyze video
         task = progress.add_task("Analyzing video...", total=None)
@@ -191,13 +221,13 @@ def analyze(
         progress.update(task, description="[green]✓ Metadata generated[/green]")
 
     # Display results
-    console.print("\n[bold cyan]Generated Metadata:[/bold cyan]\n")
+    _console().print("\n[bold cyan]Generated Metadata:[/bold cyan]\n")
 
-    console.print(f"[bold]Title:[/bold] {metadata.title}")
-    console.print(f"\n[bold]Description:[/bold]\n{metadata.description}")
-    console.print(f"\n[bold]Tags:[/bold] {', '.join(metadata.tags)}")
-    console.print(f"\n[bold]Category ID:[/bold] {metadata.category_id}")
-    console.print(f"[bold]Suggested Frame:[/bold] #{metadata.suggested_thumbnail_index}")
+    _console().print(f"[bold]Title:[/bold] {metadata.title}")
+    _console().print(f"\n[bold]Description:[/bold]\n{metadata.description}")
+    _console().print(f"\n[bold]Tags:[/bold] {', '.join(metadata.tags)}")
+    _console().print(f"\n[bold]Category ID:[/bold] {metadata.category_id}")
+    _console().print(f"[bold]Suggested Frame:[/bold] #{metadata.suggested_thumbnail_index}")
 
     # Save to JSON if requested
     if output:
@@ -215,9 +245,8 @@ def analyze(
                 "height": analysis.video_info.height,
             },
         }
-        with open(output, "w") as f:
-            json.dump(data, f, indent=2)
-        console.print(f"\n[green]✓ Saved to {output}[/green]")
+        Path(output).write_bytes(_json.dumps(data, indent=True))
+        _console().print(f"\n[green]✓ Saved to {output}[/green]")
 
 
 @app.command()
@@ -230,15 +259,15 @@ def approve(
 
     request = get_request(request_id)
     if not request:
-        console.print(f"[red]Request not found: {request_id}[/red]")
+        _console().print(f"[red]Request not found: {request_id}[/red]")
         raise typer.Exit(1)
 
     if request.get("status") != "pending":
-        console.print(f"[yellow]Request is already {request.get('status')}[/yellow]")
+        _console().print(f"[yellow]Request is already {request.get('status')}[/yellow]")
         raise typer.Exit(1)
 
     approve_request(request_id)
-    console.print(f"[green]✓ Approved request {request_id}[/green]")
+    _console().print(f"[green]✓ Approved request {request_id}[/green]")
 
     # Execute upload
     execute_upload(request)
@@ -253,23 +282,24 @@ def reject(
 
     request = get_request(request_id)
     if not request:
-        console.print(f"[red]Request not found: {request_id}[/red]")
+        _console().print(f"[red]Request not found: {request_id}[/red]")
         raise typer.Exit(1)
 
     reject_request(request_id)
-    console.print(f"[yellow]✗ Rejected request {request_id}[/yellow]")
+    _console().print(f"[yellow]✗ Rejected request {request_id}[/yellow]")
 
 
 @app.command()
 def status():
     """Show status of pending upload requests."""
-    from .approval import list_pending, load_pending_requests
+    from rich.table import Table
+
+    from .approval import load_pending_requests
 
     all_requests = load_pending_requests()
-    pending = list_pending()
 
     if not all_requests:
-        console.print("[dim]No upload requests[/dim]")
+        _console().print("[dim]No upload requests[/dim]")
         return
 
     table = Table(title="Upload Requests")
@@ -279,38 +309,40 @@ def status():
     table.add_column("Created")
 
     for req in all_requests.values():
-        status_style = {
-            "pending": "yellow",
-            "approved": "green",
-            "rejected": "red",
-        }.get(req.get("status", "unknown"), "white")
+        status_style = _STATUS_STYLE.get(req.get("status", "unknown"), "white")
+
+        title = req.get("title", "?")
+        if len(title) > 40:
+            title = title[:40] + "..."
 
         table.add_row(
             req.get("request_id", "?"),
-            req.get("title", "?")[:40] + "...",
+            title,
             f"[{status_style}]{req.get('status', 'unknown')}[/{status_style}]",
             req.get("created_at", "?")[:10],
         )
 
-    console.print(table)
+    _console().print(table)
 
 
 @app.callback(invoke_without_command=True)
 def main(ctx: typer.Context):
     """1MinAutoYT - Upload YouTube videos in one minute."""
     if ctx.invoked_subcommand is None:
+        from rich.prompt import Prompt
+
         # Interactive mode when no command specified
         print_banner()
-        console.print("\n[bold]Interactive Mode[/bold]")
-        console.print("Use --help to see available commands\n")
+        _console().print("\n[bold]Interactive Mode[/bold]")
+        _console().print("Use --help to see available commands\n")
 
         # Show quick menu
-        console.print("What would you like to do?")
-        console.print("  [cyan]1[/cyan] - Upload a video")
-        console.print("  [cyan]2[/cyan] - Watch folder for videos")
-        console.print("  [cyan]3[/cyan] - Configure settings")
-        console.print("  [cyan]4[/cyan] - Check pending uploads")
-        console.print("  [cyan]q[/cyan] - Quit")
+        _console().print("What would you like to do?")
+        _console().print("  [cyan]1[/cyan] - Upload a video")
+        _console().print("  [cyan]2[/cyan] - Watch folder for videos")
+        _console().print("  [cyan]3[/cyan] - Configure settings")
+        _console().print("  [cyan]4[/cyan] - Check pending uploads")
+        _console().print("  [cyan]q[/cyan] - Quit")
 
         choice = Prompt.ask("\nChoice", choices=["1", "2", "3", "4", "q"], default="q")
 
@@ -324,7 +356,7 @@ def main(ctx: typer.Context):
         elif choice == "4":
             ctx.invoke(status)
         else:
-            console.print("[dim]Goodbye![/dim]")
+            _console().print("[dim]Goodbye![/dim]")
 
 
 if __name__ == "__main__":
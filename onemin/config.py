@@ -14,6 +14,12 @@ def get_config_dir() -> Path:
     return Path(__file__).parent.parent
 
 
+def get_cache_dir() -> Path:
+    """Get the cache directory (~/.cache/onemin, or under $XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "onemin"
+
+
 def get_default_watch_folder() -> str:
     """Get default iCloud Documents/Upload path for current user."""
     username = os.environ.get("USER", "user")
@@ -62,6 +68,9 @@ class Settings(BaseSettings):
     # Processing settings
     max_frames: int = 10
     transcribe_model: str = "base"  # tiny, base, small, medium, large
+    transcribe_device: Optional[str] = None  # cuda, cpu (auto-detected if unset)
+    transcribe_compute_type: str = "auto"  # auto (float16 on GPU, int8 on CPU), int8, float16, ...
+    transcribe_batch_size: int = 16
 
     @classmethod
     def load(cls, config_path: Optional[Path] = None) -> "Settings":
@@ -102,6 +111,9 @@ class Settings(BaseSettings):
             "ai_model": self.ai_model,
             "max_frames": self.max_frames,
             "transcribe_model": self.transcribe_model,
+            "transcribe_device": self.transcribe_device,
+            "transcribe_compute_type": self.transcribe_compute_type,
+            "transcribe_batch_size": self.transcribe_batch_size,
         }
 
         with open(config_file, "w") as f:
@@ -128,18 +140,37 @@ class Settings(BaseSettings):
 
 # Global settings instance
 _settings: Optional[Settings] = None
+_settings_mtimes: Optional[tuple[Optional[int], ...]] = None
+
+
+def _config_mtimes() -> tuple[Optional[int], ...]:
+    """Get modification times of config.json and .env (None if missing)."""
+    config_dir = get_config_dir()
+    mtimes = []
+    for name in ("config.json", ".env"):
+        try:
+            mtimes.append((config_dir / name).stat().st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(None)
+    return tuple(mtimes)
 
 
 def get_settings() -> Settings:
-    """Get or create the global settings instance."""
-    global _settings
-    if _settings is None:
+    """Get or create the global settings instance.
+
+    Settings are only re-read when config.json or .env has changed.
+    """
+    global _settings, _settings_mtimes
+    mtimes = _config_mtimes()
+    if _settings is None or mtimes != _settings_mtimes:
         _settings = Settings.load()
+        _settings_mtimes = mtimes
     return _settings
 
 
 def reload_settings() -> Settings:
     """Reload settings from disk."""
-    global _settings
+    global _settings, _settings_mtimes
     _settings = Settings.load()
+    _settings_mtimes = _config_mtimes()
     return _settings
@@ -1,21 +1,34 @@
 """AI-powered metadata generation for YouTube videos."""
 
-from dataclasses import dataclass
-from typing import Optional
+from functools import cache
+from typing import Any, Callable, Optional, Union
+
+import msgspec
 
 from .analyzer import AnalysisResult
-from .config import get_settings
+from .config import Settings, get_settings
+
 
+class VideoMetadata(msgspec.Struct):
+    """Generated metadata for a YouTube video.
 
-@dataclass
-class VideoMetadata:
-    """Generated metadata for a YouTube video."""
+    A msgspec Struct so provider JSON responses decode and validate in one pass.
+    """
 
     title: str
     description: str
     tags: list[str]
-    category_id: str  # YouTube category ID
-    suggested_thumbnail_index: int  # Which frame to use
+    category_id: Union[str, int]  # YouTube category ID, normalized to str
+    suggested_thumbnail_index: int = 0  # Which frame to use
+
+    def __post_init__(self) -> None:
+        # LLMs often return the category as a number
+        self.category_id = str(self.category_id)
+
+
+def _decode_metadata(text: str) -> VideoMetadata:
+    """Decode a provider's JSON response, coercing quirks like "3" for 3."""
+    return msgspec.json.decode(text, type=VideoMetadata, strict=False)
 
 
 METADATA_PROMPT = """You are a YouTube content optimization expert. Generate engaging metadata for a video based on its transcript.
@@ -54,25 +67,48 @@ Respond with ONLY valid JSON, no markdown code blocks:
 """
 
 
-def generate_metadata_anthropic(
-    analysis: AnalysisResult,
-    custom_instructions: Optional[str] = None,
-) -> VideoMetadata:
-    """Generate metadata using Anthropic Claude."""
-    settings = get_settings()
-
+# SDK clients are cached so their connection pools are reused across videos
+@cache
+def _anthropic_client(api_key: str) -> Any:
+    """Get a shared Anthropic client for an API key."""
     try:
         import anthropic
     except ImportError:
         raise ImportError("anthropic not installed. Run: pip install anthropic")
 
-    if not settings.anthropic_api_key:
-        raise ValueError("ANTHROPIC_API_KEY not set in .env")
+    return anthropic.Anthropic(api_key=api_key)
+
+
+@cache
+def _openai_client(api_key: str, base_url: Optional[str] = None) -> Any:
+    """Get a shared OpenAI-compatible client for an API key and endpoint."""
+    try:
+        import openai  # DeepSeek uses OpenAI-compatible API
+    except ImportError:
+        raise ImportError("openai not installed. Run: pip install openai")
+
+    return openai.OpenAI(api_key=api_key, base_url=base_url)
+
+
+@cache
+def _gemini_model(api_key: str, model_name: str) -> Any:
+    """Get a shared Gemini model, configuring the API key once."""
+    try:
+        import google.generativeai as genai
+    except ImportError:
+        raise ImportError("google-generativeai not installed. Run: pip install google-generativeai")
 
-    client = anthropic.Anthropic(api_key=settings.anthropic_api_key)
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
 
+
+def _build_prompt(
+    analysis: AnalysisResult,
+    custom_instructions: Optional[str] = None,
+) -> str:
+    """Build the metadata prompt for a video."""
     prompt = METADATA_PROMPT.format(
-        transcript=analysis.transcript[:8000],  # Limit transcript length
+        transcript=analysis.prompt_transcript,
         duration=analysis.video_info.duration,
         minutes=analysis.video_info.duration / 60,
         width=analysis.video_info.width,
@@ -83,54 +119,42 @@ def generate_metadata_anthropic(
     if custom_instructions:
         prompt += f"\n\nADDITIONAL INSTRUCTIONS:\n{custom_instructions}"
 
+    return prompt
+
+
+def generate_metadata_anthropic(
+    prompt: str,
+    settings: Optional[Settings] = None,
+) -> VideoMetadata:
+    """Generate metadata using Anthropic Claude."""
+    settings = settings or get_settings()
+
+    if not settings.anthropic_api_key:
+        raise ValueError("ANTHROPIC_API_KEY not set in .env")
+
+    client = _anthropic_client(settings.anthropic_api_key)
+
     message = client.messages.create(
         model=settings.ai_model,
         max_tokens=1024,
         messages=[{"role": "user", "content": prompt}],
     )
 
-    # Parse JSON response
-    import json
-    response_text = message.content[0].text
-    data = json.loads(response_text)
-
-    return VideoMetadata(
-        title=data["title"],
-        description=data["description"],
-        tags=data["tags"],
-        category_id=data["category_id"],
-        suggested_thumbnail_index=data.get("suggested_thumbnail_index", 0),
-    )
+    # Parse and validate the JSON response
+    return _decode_metadata(message.content[0].text)
 
 
 def generate_metadata_openai(
-    analysis: AnalysisResult,
-    custom_instructions: Optional[str] = None,
+    prompt: str,
+    settings: Optional[Settings] = None,
 ) -> VideoMetadata:
     """Generate metadata using OpenAI GPT."""
-    settings = get_settings()
-
-    try:
-        import openai
-    except ImportError:
-        raise ImportError("openai not installed. Run: pip install openai")
+    settings = settings or get_settings()
 
     if not settings.openai_api_key:
         raise ValueError("OPENAI_API_KEY not set in .env")
 
-    client = openai.OpenAI(api_key=settings.openai_api_key)
-
-    prompt = METADATA_PROMPT.format(
-        transcript=analysis.transcript[:8000],
-        duration=analysis.video_info.duration,
-        minutes=analysis.video_info.duration / 60,
-        width=analysis.video_info.width,
-        height=analysis.video_info.height,
-        filename=analysis.video_info.path.name,
-    )
-
-    if custom_instructions:
-        prompt += f"\n\nADDITIONAL INSTRUCTIONS:\n{custom_instructions}"
+    client = _openai_client(settings.openai_api_key)
 
     response = client.chat.completions.create(
         model="gpt-4o",
@@ -138,49 +162,21 @@ def generate_metadata_openai(
         response_format={"type": "json_object"},
     )
 
-    import json
-    data = json.loads(response.choices[0].message.content)
-
-    return VideoMetadata(
-        title=data["title"],
-        description=data["description"],
-        tags=data["tags"],
-        category_id=data["category_id"],
-        suggested_thumbnail_index=data.get("suggested_thumbnail_index", 0),
-    )
+    # Parse and validate the JSON response
+    return _decode_metadata(response.choices[0].message.content)
 
 
 def generate_metadata_deepseek(
-    analysis: AnalysisResult,
-    custom_instructions: Optional[str] = None,
+    prompt: str,
+    settings: Optional[Settings] = None,
 ) -> VideoMetadata:
     """Generate metadata using DeepSeek."""
-    settings = get_settings()
-
-    try:
-        import openai  # DeepSeek uses OpenAI-compatible API
-    except ImportError:
-        raise ImportError("openai not installed. Run: pip install openai")
+    settings = settings or get_settings()
 
     if not settings.deepseek_api_key:
         raise ValueError("DEEPSEEK_API_KEY not set in .env")
 
-    client = openai.OpenAI(
-        api_key=settings.deepseek_api_key,
-        base_url="https://api.deepseek.com/v1",
-    )
-
-    prompt = METADATA_PROMPT.format(
-        transcript=analysis.transcript[:8000],
-        duration=analysis.video_info.duration,
-        minutes=analysis.video_info.duration / 60,
-        width=analysis.video_info.width,
-        height=analysis.video_info.height,
-        filename=analysis.video_info.path.name,
-    )
-
-    if custom_instructions:
-        prompt += f"\n\nADDITIONAL INSTRUCTIONS:\n{custom_instructions}"
+    client = _openai_client(settings.deepseek_api_key, "https://api.deepseek.com/v1")
 
     response = client.chat.completions.create(
         model=settings.ai_model or "deepseek-chat",
@@ -188,81 +184,52 @@ def generate_metadata_deepseek(
         response_format={"type": "json_object"},
     )
 
-    import json
-    data = json.loads(response.choices[0].message.content)
-
-    return VideoMetadata(
-        title=data["title"],
-        description=data["description"],
-        tags=data["tags"],
-        category_id=data["category_id"],
-        suggested_thumbnail_index=data.get("suggested_thumbnail_index", 0),
-    )
+    # Parse and validate the JSON response
+    return _decode_metadata(response.choices[0].message.content)
 
 
 def generate_metadata_gemini(
-    analysis: AnalysisResult,
-    custom_instructions: Optional[str] = None,
+    prompt: str,
+    settings: Optional[Settings] = None,
 ) -> VideoMetadata:
     """Generate metadata using Google Gemini."""
-    settings = get_settings()
-
-    try:
-        import google.generativeai as genai
-    except ImportError:
-        raise ImportError("google-generativeai not installed. Run: pip install google-generativeai")
+    settings = settings or get_settings()
 
     if not settings.google_api_key:
         raise ValueError("GOOGLE_API_KEY not set in .env")
 
-    genai.configure(api_key=settings.google_api_key)
-    model = genai.GenerativeModel(settings.ai_model or "gemini-1.5-flash")
-
-    prompt = METADATA_PROMPT.format(
-        transcript=analysis.transcript[:8000],
-        duration=analysis.video_info.duration,
-        minutes=analysis.video_info.duration / 60,
-        width=analysis.video_info.width,
-        height=analysis.video_info.height,
-        filename=analysis.video_info.path.name,
-    )
-
-    if custom_instructions:
-        prompt += f"\n\nADDITIONAL INSTRUCTIONS:\n{custom_instructions}"
+    model = _gemini_model(settings.google_api_key, settings.ai_model or "gemini-1.5-flash")
 
     response = model.generate_content(
         prompt,
-        generation_config=genai.types.GenerationConfig(
-            response_mime_type="application/json",
-        ),
+        generation_config={"response_mime_type": "application/json"},
     )
 
-    import json
-    data = json.loads(response.text)
+    # Parse and validate the JSON response
+    return _decode_metadata(response.text)
 
-    return VideoMetadata(
-        title=data["title"],
-        description=data["description"],
-        tags=data["tags"],
-        category_id=data["category_id"],
-        suggested_thumbnail_index=data.get("suggested_thumbnail_index", 0),
-    )
+
+# Metadata generator for each supported ai_provider setting
+_PROVIDERS: dict[str, Callable[[str, Settings], VideoMetadata]] = {
+    "deepseek": generate_metadata_deepseek,
+    "anthropic": generate_metadata_anthropic,
+    "openai": generate_metadata_openai,
+    "gemini": generate_metadata_gemini,
+}
 
 
 def generate_metadata(
     analysis: AnalysisResult,
     custom_instructions: Optional[str] = None,
+    settings: Optional[Settings] = None,
 ) -> VideoMetadata:
     """Generate metadata using configured AI provider."""
-    settings = get_settings()
-
-    if settings.ai_provider == "deepseek":
-        return generate_metadata_deepseek(analysis, custom_instructions)
-    elif settings.ai_provider == "anthropic":
-        return generate_metadata_anthropic(analysis, custom_instructions)
-    elif settings.ai_provider == "openai":
-        return generate_metadata_openai(analysis, custom_instructions)
-    elif settings.ai_provider == "gemini":
-        return generate_metadata_gemini(analysis, custom_instructions)
-    else:
+    settings = settings or get_settings()
+    prompt = _build_prompt(analysis, custom_instructions)
+
+    try:
+        generate = _PROVIDERS[settings.ai_provider]
+    except KeyError:
         raise ValueError(f"Unknown AI provider: {settings.ai_provider}")
+
+    return generate(prompt, settings)
@@ -1,9 +1,13 @@
 """Main processing pipeline - ties everything together."""
 
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -11,12 +15,15 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from .analyzer import analyze_video, AnalysisResult
 from .metadata import generate_metadata, VideoMetadata
 from .thumbnail import generate_thumbnail, ThumbnailResult
-from .approval import create_approval_request, send_telegram_approval
+from .approval import create_approval_request, send_telegram_approval_async
 from .uploader import upload_video, UploadResult
 from .config import get_settings
 
 console = Console()
 
+# Rich allows only one live display at a time
+_progress_lock = threading.Lock()
+
 
 @dataclass
 class ProcessOptions:
@@ -44,9 +51,30 @@ class ProcessResult:
     status: str = "pending"  # pending, uploaded, error
 
 
+@contextmanager
+def _progress() -> Iterator[Progress]:
+    """Spinner progress for a video, disabled if another video already shows one.
+
+    Videos processed concurrently by the watcher run without a spinner.
+    """
+    acquired = _progress_lock.acquire(blocking=False)
+    try:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            disable=not acquired,
+        ) as progress:
+            yield progress
+    finally:
+        if acquired:
+            _progress_lock.release()
+
+
 def process_video(
     video_path: Path,
     options: Optional[ProcessOptions] = None,
+    analysis: Optional[AnalysisResult] = None,
 ) -> ProcessResult:
     """Process a video through the full pipeline.
 
@@ -59,32 +87,31 @@ def process_video(
     Args:
         video_path: Path to the video file
         options: Processing options
+        analysis: Pre-computed analysis of the video. Skips step 1 if given.
 
     Returns:
         ProcessResult with all generated data
     """
     options = options or ProcessOptions()
+    # Resolve settings once and hand them to every step
     settings = get_settings()
 
     console.print(f"\n[bold cyan]Processing:[/bold cyan] {video_path.name}")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
+    with _progress() as progress:
         # Step 1: Analyze video
         task = progress.add_task("Analyzing video...", total=None)
 
         work_dir = Path(tempfile.mkdtemp(prefix="onemin_"))
-        analysis = analyze_video(video_path, work_dir)
+        if analysis is None:
+            analysis = analyze_video(video_path, work_dir, settings)
 
         progress.update(task, description="[green]✓ Video analyzed[/green]")
 
         # Step 2: Generate metadata
         task = progress.add_task("Generating metadata...", total=None)
 
-        metadata = generate_metadata(analysis)
+        metadata = generate_metadata(analysis, settings=settings)
 
         # Apply custom overrides
         if options.custom_title:
@@ -105,6 +132,7 @@ def process_video(
             metadata,
             thumbnail_path,
             custom_frame=options.custom_thumbnail,
+            settings=settings,
         )
 
         progress.update(task, description="[green]✓ Thumbnail created[/green]")
@@ -135,6 +163,7 @@ def process_video(
             metadata,
             thumbnail.path,
             privacy=options.privacy,
+            settings=settings,
         )
         result.upload_result = upload_result
         result.status = "uploaded"
@@ -150,22 +179,73 @@ def process_video(
         )
         result.request_id = request.request_id
 
-        # Send Telegram notification
-        sent = send_telegram_approval(request, analysis)
+        # Send Telegram notification in the background so the next video
+        # can start while it is in flight
+        send_telegram_approval_async(request, analysis, settings)
 
-        if sent:
-            console.print(f"\n[yellow]📱 Approval request sent to Telegram[/yellow]")
-            console.print(f"[bold]Request ID:[/bold] {request.request_id}")
-        else:
-            console.print(f"\n[yellow]Waiting for approval[/yellow]")
-            console.print(f"[bold]Request ID:[/bold] {request.request_id}")
-            console.print(f"Run: [cyan]1minautoyt approve {request.request_id}[/cyan]")
+        console.print(f"\n[yellow]Waiting for approval[/yellow]")
+        console.print(f"[bold]Request ID:[/bold] {request.request_id}")
+        console.print(f"Run: [cyan]1minautoyt approve {request.request_id}[/cyan]")
 
         result.status = "pending"
 
     return result
 
 
+def process_videos(
+    video_paths: list[Path],
+    options: Optional[ProcessOptions] = None,
+    max_workers: int = 2,
+) -> list[ProcessResult]:
+    """Process several videos through the pipeline.
+
+    Upcoming videos are analyzed in the background while metadata and
+    thumbnails are generated for the current one, so ffmpeg/Whisper work
+    overlaps with the AI provider round-trips. At most max_workers
+    analyses are in flight at a time. A video that fails is logged and
+    skipped.
+
+    Args:
+        video_paths: Paths to the video files, processed in order
+        options: Processing options applied to every video
+        max_workers: Maximum number of videos analyzed concurrently
+
+    Returns:
+        ProcessResult for each successfully processed video, in order
+    """
+    settings = get_settings()
+    results = []
+    remaining = iter(video_paths)
+    in_flight: deque[tuple[Path, Future]] = deque()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit_next() -> None:
+        path = next(remaining, None)
+        if path is not None:
+            work_dir = Path(tempfile.mkdtemp(prefix="onemin_"))
+            future = executor.submit(analyze_video, path, work_dir, settings)
+            in_flight.append((path, future))
+
+    try:
+        for _ in range(max_workers):
+            submit_next()
+
+        while in_flight:
+            path, analysis = in_flight.popleft()
+            # Keep the analysis queue full while this video is consumed
+            submit_next()
+
+            try:
+                results.append(process_video(path, options, analysis=analysis.result()))
+            except Exception as e:
+                console.print(f"[red]Failed to process {path.name}: {e}[/red]")
+    finally:
+        # Only reached with queued analyses on a fatal error (e.g. Ctrl+C)
+        executor.shutdown(wait=True, cancel_futures=True)
+
+    return results
+
+
 def execute_upload(request_data: dict) -> Optional[UploadResult]:
     """Execute an approved upload request.
 
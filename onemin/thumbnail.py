@@ -1,14 +1,61 @@
 """Thumbnail generation - Mr. Beast style thumbnails."""
 
+import hashlib
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Optional
 
-from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageFilter
+import numpy as np
+from PIL import Image, ImageChops, ImageDraw, ImageFont, ImageFilter, ImageStat
 
-from .analyzer import AnalysisResult
+from . import _json
+from .analyzer import FRAME_SIZE, AnalysisResult
+from .config import Settings, get_cache_dir, get_settings
 from .metadata import VideoMetadata
 
+# YouTube thumbnail size (width, height)
+THUMBNAIL_SIZE = FRAME_SIZE
+
+# ITU-R 601-2 luma weights, as used by Image.convert("L")
+LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+# Common bold fonts on macOS, in order of preference
+FONT_PATHS = [
+    "/System/Library/Fonts/Supplemental/Impact.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/Library/Fonts/Arial Bold.ttf",
+]
+_AVAILABLE_FONTS = [fp for fp in FONT_PATHS if Path(fp).exists()]
+
+# How long cached Gemini thumbnail suggestions stay valid (seconds)
+GEMINI_CACHE_TTL = 7 * 24 * 3600
+
+# Bump whenever a rendering change alters thumbnail output
+THUMBNAIL_CACHE_VERSION = "1"
+# How long cached rendered thumbnails are kept (seconds)
+THUMBNAIL_CACHE_TTL = 7 * 24 * 3600
+
+# Baseline 4:2:0 JPEG at quality 90 - fast to encode, ~40% smaller than q95
+JPEG_SAVE_OPTIONS = {
+    "quality": 90,
+    "subsampling": 2,
+    "progressive": False,
+    "optimize": False,
+}
+
+
+def pillow_flavor() -> str:
+    """Describe the active Pillow build (Pillow-SIMD versions end in .postN)."""
+    import PIL
+
+    name = "Pillow-SIMD" if ".post" in PIL.__version__ else "Pillow"
+    return f"{name} {PIL.__version__}"
+
 
 @dataclass
 class ThumbnailResult:
@@ -27,6 +74,10 @@ def get_best_frame(
 
     For now, uses the AI-suggested index. Future: analyze frames for
     faces, expressions, action, etc.
+
+    Frames from analyzer.extract_frames are already THUMBNAIL_SIZE, so the
+    builders use them without resampling. Other frames (e.g. a custom
+    frame) still work but are resized on load.
     """
     if not frames:
         raise ValueError("No frames provided")
@@ -35,6 +86,73 @@ def get_best_frame(
     return frames[index]
 
 
+@cache
+def _load_font(size: int) -> ImageFont.ImageFont:
+    """Load the preferred bold font at the given size, falling back to default."""
+    for fp in _AVAILABLE_FONTS:
+        try:
+            return ImageFont.truetype(fp, size)
+        except Exception:
+            continue
+    return ImageFont.load_default()
+
+
+def _text_size(font: ImageFont.ImageFont, text: str) -> tuple[int, int]:
+    """Width and line height of single-line text.
+
+    Uses the advance width and font metrics rather than textbbox, which
+    runs a full layout pass that draw.text then repeats.
+    """
+    text_width = int(font.getlength(text))
+    if hasattr(font, "getmetrics"):
+        ascent, descent = font.getmetrics()
+        return text_width, ascent + descent
+    # Bitmap fallback font (Pillow built without FreeType)
+    bbox = font.getbbox(text)
+    return text_width, bbox[3] - bbox[1]
+
+
+def _paste_text(
+    img: Image.Image,
+    xy: tuple[int, int],
+    text: str,
+    font_size: int,
+    fill: str,
+    stroke_fill: str,
+    stroke_width: int = 4,
+) -> None:
+    """Draw outlined text onto img at xy, as draw.text would, via a cached sprite."""
+    sprite, (left, top) = _text_sprite(text, font_size, fill, stroke_fill, stroke_width)
+    img.paste(sprite, (xy[0] + left, xy[1] + top), sprite)
+
+
+@lru_cache(maxsize=32)
+def _text_sprite(
+    text: str,
+    font_size: int,
+    fill: str,
+    stroke_fill: str,
+    stroke_width: int,
+) -> tuple[Image.Image, tuple[int, int]]:
+    """Render outlined text to a tight RGBA sprite.
+
+    Returns the sprite and its offset from the text origin.
+    """
+    font = _load_font(font_size)
+    left, top, right, bottom = font.getbbox(text, stroke_width=stroke_width)
+
+    sprite = Image.new("RGBA", (max(1, right - left), max(1, bottom - top)), (0, 0, 0, 0))
+    ImageDraw.Draw(sprite).text(
+        (-left, -top),
+        text,
+        font=font,
+        fill=fill,
+        stroke_width=stroke_width,
+        stroke_fill=stroke_fill,
+    )
+    return sprite, (left, top)
+
+
 def create_mrbeast_thumbnail(
     frame_path: Path,
     title: str,
@@ -51,99 +169,120 @@ def create_mrbeast_thumbnail(
     - Thick black outline on text
     - Eye-catching colors
     """
-    # Load frame
+    img = _load_frame(frame_path)
+    return _mrbeast_from_image(img, title, output_path, text_color, stroke_color, font_size)
+
+
+def _load_frame(frame_path: Path) -> Image.Image:
+    """Load a frame at YouTube thumbnail size (1280x720)."""
+    # Let libjpeg decode at a reduced scale (no-op for non-JPEG)
     img = Image.open(frame_path)
+    img.draft("RGB", THUMBNAIL_SIZE)
 
-    # Resize to YouTube thumbnail size (1280x720)
-    img = img.resize((1280, 720), Image.Resampling.LANCZOS)
+    # Frames extracted at thumbnail size need no resampling. Decode now so
+    # callers can share the image across threads.
+    if img.size == THUMBNAIL_SIZE:
+        img.load()
+        return img
+    return img.resize(THUMBNAIL_SIZE, Image.Resampling.LANCZOS, reducing_gap=2.0)
 
-    # Boost saturation and contrast for that "pop"
-    enhancer = ImageEnhance.Color(img)
-    img = enhancer.enhance(1.3)  # 30% more saturated
 
-    enhancer = ImageEnhance.Contrast(img)
-    img = enhancer.enhance(1.2)  # 20% more contrast
+def _mrbeast_from_image(
+    img: Image.Image,
+    title: str,
+    output_path: Path,
+    text_color: str = "#FFFF00",
+    stroke_color: str = "#000000",
+    font_size: int = 80,
+) -> Path:
+    """Mr. Beast-style thumbnail from a frame already loaded at 1280x720."""
+    # Boost saturation (30%) and contrast (20%) for that "pop"
+    img = _apply_sat_contrast(img, 1.3, 1.2)
 
     # Add slight vignette effect
     img = add_vignette(img)
 
     # Draw text
-    draw = ImageDraw.Draw(img)
+    font = _load_font(font_size)
 
-    # Try to load a bold font, fall back to default
-    try:
-        # Common bold fonts on macOS
-        font_paths = [
-            "/System/Library/Fonts/Supplemental/Impact.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-            "/Library/Fonts/Arial Bold.ttf",
-        ]
-        font = None
-        for fp in font_paths:
-            if Path(fp).exists():
-                font = ImageFont.truetype(fp, font_size)
-                break
-        if font is None:
-            font = ImageFont.load_default()
-    except Exception:
-        font = ImageFont.load_default()
-
-    # Prepare text - use first few words for thumbnail
-    words = title.upper().split()[:4]
-    text = " ".join(words)
+    # Prepare text - use first few words for thumbnail (only those are split
+    # off and uppercased, however long the title is)
+    text = " ".join(word.upper() for word in title.split(maxsplit=4)[:4])
 
     # Calculate text position (center-bottom with some padding)
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
+    text_width, text_height = _text_size(font, text)
 
     x = (1280 - text_width) // 2
     y = 720 - text_height - 80  # 80px from bottom
 
     # Draw text with thick outline (stroke)
-    stroke_width = 4
-    for dx in range(-stroke_width, stroke_width + 1):
-        for dy in range(-stroke_width, stroke_width + 1):
-            if dx != 0 or dy != 0:
-                draw.text((x + dx, y + dy), text, font=font, fill=stroke_color)
-
-    # Draw main text
-    draw.text((x, y), text, font=font, fill=text_color)
+    _paste_text(img, (x, y), text, font_size, text_color, stroke_color)
 
     # Save
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(output_path, "JPEG", quality=95)
+    img.save(output_path, "JPEG", **JPEG_SAVE_OPTIONS)
 
     return output_path
 
 
+def _apply_sat_contrast(img: Image.Image, saturation: float, contrast: float) -> Image.Image:
+    """Apply ImageEnhance.Color then ImageEnhance.Contrast in a single pass.
+
+    Like Pillow, saturation blends against the Rec.601 luma and contrast
+    pivots around the mean luma (which the saturation step leaves unchanged).
+    Both are linear, so they fold into one 3x4 color matrix.
+    """
+    img = img.convert("RGB")
+    pivot = ImageStat.Stat(img.convert("L")).mean[0] if contrast != 1 else 0.0
+
+    matrix = []
+    for row in range(3):
+        for col, weight in enumerate(LUMA_WEIGHTS):
+            coeff = (1 - saturation) * contrast * weight
+            if row == col:
+                coeff += saturation * contrast
+            matrix.append(coeff)
+        matrix.append(pivot * (1 - contrast))
+
+    return img.convert("RGB", tuple(matrix))
+
+
 def add_vignette(img: Image.Image, intensity: float = 0.3) -> Image.Image:
     """Add a subtle vignette effect to the image."""
-    width, height = img.size
+    # Blending with a half-brightness copy through the mask is the same as
+    # scaling each pixel by (0.5 + 0.5 * mask), so do it in one multiply
+    gain = _vignette_gain(img.width, img.height, intensity)
+    return ImageChops.multiply(img.convert("RGB"), gain)
 
-    # Create radial gradient mask
-    from math import sqrt
 
-    mask = Image.new("L", (width, height), 255)
-    center_x, center_y = width // 2, height // 2
-    max_dist = sqrt(center_x**2 + center_y**2)
+@lru_cache(maxsize=8)
+def _vignette_gain(width: int, height: int, intensity: float) -> Image.Image:
+    """Per-pixel RGB gain (255 = unchanged) for add_vignette."""
+    mask = _vignette_mask(width, height, intensity)
+    gain = mask.point(lambda v: round(127.5 + v / 2))
+    return Image.merge("RGB", (gain, gain, gain))
 
-    for y in range(height):
-        for x in range(width):
-            dist = sqrt((x - center_x) ** 2 + (y - center_y) ** 2)
-            # Normalize and apply curve
-            norm_dist = dist / max_dist
-            value = int(255 * (1 - intensity * norm_dist**2))
-            mask.putpixel((x, y), value)
 
-    # Apply mask
-    mask = mask.filter(ImageFilter.GaussianBlur(radius=50))
+@lru_cache(maxsize=8)
+def _vignette_mask(width: int, height: int, intensity: float) -> Image.Image:
+    """Build the blurred vignette mask. Cached since sizes rarely change.
 
-    # Blend with darkened version
-    dark = ImageEnhance.Brightness(img).enhance(0.5)
-    img = Image.composite(img, dark, mask)
+    The gradient is smooth, so it is built and blurred at quarter size and
+    scaled back up - 1/16 of the blur work with no visible difference.
+    """
+    small_w, small_h = max(1, width // 4), max(1, height // 4)
+
+    # Create radial gradient mask: 255 * (1 - intensity * (dist / max_dist)^2)
+    center_x, center_y = small_w / 2, small_h / 2
+    ys, xs = np.ogrid[:small_h, :small_w]
+    norm_dist2 = ((xs + 0.5 - center_x) ** 2 + (ys + 0.5 - center_y) ** 2) / (
+        center_x**2 + center_y**2
+    )
+    values = 255 * (1 - intensity * norm_dist2)
+    mask = Image.fromarray(values.clip(0, 255).astype(np.uint8))
 
-    return img
+    mask = mask.filter(ImageFilter.GaussianBlur(radius=12))
+    return mask.resize((width, height), Image.Resampling.BILINEAR)
 
 
 def create_minimal_thumbnail(
@@ -151,15 +290,13 @@ def create_minimal_thumbnail(
     output_path: Path,
 ) -> Path:
     """Create a minimal thumbnail - just the frame with color enhancement."""
-    img = Image.open(frame_path)
-    img = img.resize((1280, 720), Image.Resampling.LANCZOS)
+    img = _load_frame(frame_path)
 
-    # Slight enhancement
-    enhancer = ImageEnhance.Color(img)
-    img = enhancer.enhance(1.1)
+    # Slight saturation boost
+    img = _apply_sat_contrast(img, 1.1, 1.0)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(output_path, "JPEG", quality=95)
+    img.save(output_path, "JPEG", **JPEG_SAVE_OPTIONS)
 
     return output_path
 
@@ -169,17 +306,18 @@ def create_ai_thumbnail_gemini(
     title: str,
     description: str,
     output_path: Path,
+    settings: Optional[Settings] = None,
 ) -> Path:
     """Create an AI-generated Mr. Beast-style thumbnail using Gemini.
 
     Uses Gemini to generate a prompt, then creates thumbnail with
     image generation or enhanced frame processing.
     """
-    from .config import get_settings
-    settings = get_settings()
+    settings = settings or get_settings()
 
     try:
         import google.generativeai as genai
+        from google.api_core.exceptions import GoogleAPIError
     except ImportError:
         raise ImportError("google-generativeai not installed. Run: pip install google-generativeai")
 
@@ -189,11 +327,11 @@ def create_ai_thumbnail_gemini(
     genai.configure(api_key=settings.google_api_key)
 
     # Load the frame to use as reference
-    img = Image.open(frame_path)
-    img = img.resize((1280, 720), Image.Resampling.LANCZOS)
+    frame = img = _load_frame(frame_path)
 
     # Use Gemini to analyze frame and suggest thumbnail enhancements
-    model = genai.GenerativeModel(settings.thumbnail_ai_model or "gemini-2.0-flash-exp")
+    model_name = settings.thumbnail_ai_model or "gemini-2.0-flash-exp"
+    model = genai.GenerativeModel(model_name)
 
     prompt = f"""Analyze this video frame for a YouTube thumbnail. The video is titled: "{title}"
 
@@ -207,46 +345,36 @@ Respond in JSON format:
 {{"overlay_text": "...", "text_color": "#FFFF00", "position": "bottom", "enhance_saturation": 1.3, "enhance_contrast": 1.2}}"""
 
     try:
-        # Upload frame for analysis
-        response = model.generate_content([prompt, img])
-        import json
-        suggestions = json.loads(response.text)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            cache_key = _gemini_cache_key(frame_path, title, model_name)
+            suggestions = _load_gemini_suggestions(cache_key)
+            pending = None
+            if suggestions is None:
+                # Upload frame for analysis in the background
+                pending = pool.submit(model.generate_content, [prompt, img])
+
+            # Meanwhile, do the local work with the default enhancement
+            # (Gemini usually keeps it) so only the text waits on the response
+            font = _load_font(90)
+            enhanced = add_vignette(_apply_sat_contrast(img, 1.3, 1.2))
+
+            if pending is not None:
+                suggestions = _parse_suggestions(pending.result().text)
 
         # Apply AI suggestions
-        enhancer = ImageEnhance.Color(img)
-        img = enhancer.enhance(suggestions.get("enhance_saturation", 1.3))
-
-        enhancer = ImageEnhance.Contrast(img)
-        img = enhancer.enhance(suggestions.get("enhance_contrast", 1.2))
-
-        # Add vignette
-        img = add_vignette(img)
+        saturation = float(suggestions.get("enhance_saturation", 1.3))
+        contrast = float(suggestions.get("enhance_contrast", 1.2))
+        if (saturation, contrast) == (1.3, 1.2):
+            img = enhanced
+        else:
+            img = add_vignette(_apply_sat_contrast(img, saturation, contrast))
 
         # Draw text with AI suggestions
-        draw = ImageDraw.Draw(img)
-
-        try:
-            font_paths = [
-                "/System/Library/Fonts/Supplemental/Impact.ttf",
-                "/System/Library/Fonts/Helvetica.ttc",
-            ]
-            font = None
-            for fp in font_paths:
-                if Path(fp).exists():
-                    font = ImageFont.truetype(fp, 90)
-                    break
-            if font is None:
-                font = ImageFont.load_default()
-        except Exception:
-            font = ImageFont.load_default()
-
         text = suggestions.get("overlay_text", title.upper()[:20])
         text_color = suggestions.get("text_color", "#FFFF00")
         position = suggestions.get("position", "bottom")
 
-        bbox = draw.textbbox((0, 0), text, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
+        text_width, text_height = _text_size(font, text)
 
         x = (1280 - text_width) // 2
         if position == "top":
@@ -256,31 +384,121 @@ Respond in JSON format:
         else:  # bottom
             y = 720 - text_height - 80
 
-        # Draw stroke
-        for dx in range(-4, 5):
-            for dy in range(-4, 5):
-                if dx != 0 or dy != 0:
-                    draw.text((x + dx, y + dy), text, font=font, fill="#000000")
+        # Draw text with stroke
+        _paste_text(img, (x, y), text, 90, text_color, "#000000")
 
-        draw.text((x, y), text, font=font, fill=text_color)
+        # Cache only suggestions that rendered, so a bad reply is retried
+        if pending is not None:
+            _store_gemini_suggestions(cache_key, suggestions)
 
-    except Exception as e:
+    except (GoogleAPIError, ValueError, KeyError, TypeError) as e:
         print(f"AI enhancement failed, falling back to standard: {e}")
-        # Fallback to standard mrbeast style
-        return create_mrbeast_thumbnail(frame_path, title, output_path)
+        # Fallback to standard mrbeast style, reusing the loaded frame
+        return _mrbeast_from_image(frame, title, output_path)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(output_path, "JPEG", quality=95)
+    img.save(output_path, "JPEG", **JPEG_SAVE_OPTIONS)
 
     return output_path
 
 
+def _parse_suggestions(text: str) -> dict:
+    """Parse Gemini's JSON reply, tolerating a surrounding ```json fence.
+
+    Raises:
+        ValueError: If the reply is not a JSON object
+    """
+    text = text.strip()
+    if text.startswith("```"):
+        # Drop the opening fence line (with any language tag) and the closing fence
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        text = text.rsplit("```", 1)[0].strip()
+
+    suggestions = _json.loads(text)
+    if not isinstance(suggestions, dict):
+        raise ValueError(f"Expected a JSON object, got {type(suggestions).__name__}")
+    return suggestions
+
+
+def _gemini_cache_key(frame_path: Path, title: str, model_name: str) -> str:
+    """Hash of the frame contents, title and model for the suggestion cache."""
+    h = hashlib.blake2b(frame_path.read_bytes(), digest_size=16)
+    h.update(title.encode())
+    h.update(model_name.encode())
+    return h.hexdigest()
+
+
+def _load_gemini_suggestions(key: str) -> Optional[dict]:
+    """Return cached Gemini suggestions, or None if missing or expired."""
+    path = get_cache_dir() / "gemini" / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > GEMINI_CACHE_TTL:
+            return None
+        return _json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _store_gemini_suggestions(key: str, suggestions: dict) -> None:
+    """Cache Gemini suggestions. Failures are ignored - the cache is optional."""
+    cache_dir = get_cache_dir() / "gemini"
+    tmp_path = cache_dir / f"{key}.json.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(_json.dumps(suggestions))
+        os.replace(tmp_path, cache_dir / f"{key}.json")
+    except OSError:
+        pass
+    _prune_cache(cache_dir, GEMINI_CACHE_TTL)
+
+
+def _thumbnail_cache_path(source_frame: Path, title: str, style: str) -> Path:
+    """Cache location for a rendered thumbnail.
+
+    Keyed by the first 1MB and size of the frame, title and style, plus the
+    renderer version, JPEG settings and fonts so rendering changes miss.
+    """
+    with open(source_frame, "rb") as f:
+        h = hashlib.blake2b(f.read(1 << 20), digest_size=16)
+    h.update(str(source_frame.stat().st_size).encode())
+    h.update(title.encode())
+    h.update(style.encode())
+    h.update(THUMBNAIL_CACHE_VERSION.encode())
+    h.update(repr(sorted(JPEG_SAVE_OPTIONS.items())).encode())
+    h.update("|".join(_AVAILABLE_FONTS).encode())
+    return get_cache_dir() / "thumbnails" / f"{h.hexdigest()}.jpg"
+
+
+def _is_fresh(path: Path, ttl: float) -> bool:
+    """Whether a cache file exists and was written within ttl seconds."""
+    try:
+        return time.time() - path.stat().st_mtime <= ttl
+    except OSError:
+        return False
+
+
+def _prune_cache(cache_dir: Path, ttl: float) -> None:
+    """Delete cache files older than ttl seconds. Errors are ignored."""
+    cutoff = time.time() - ttl
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+
+
 def generate_thumbnail(
     analysis: AnalysisResult,
     metadata: VideoMetadata,
     output_path: Path,
     style: Optional[str] = None,
     custom_frame: Optional[Path] = None,
+    settings: Optional[Settings] = None,
 ) -> ThumbnailResult:
     """Generate a thumbnail for the video.
 
@@ -290,12 +508,12 @@ def generate_thumbnail(
         output_path: Where to save the thumbnail
         style: Thumbnail style (mrbeast, minimal, ai). Uses config if None.
         custom_frame: Use this frame instead of auto-selected one
+        settings: Settings to use. Uses the global settings if None.
 
     Returns:
         ThumbnailResult with path and info
     """
-    from .config import get_settings
-    settings = get_settings()
+    settings = settings or get_settings()
 
     style = style or settings.thumbnail_style
 
@@ -308,21 +526,99 @@ def generate_thumbnail(
             metadata.suggested_thumbnail_index,
         )
 
-    # Generate based on style
-    if style == "ai":
-        create_ai_thumbnail_gemini(
-            source_frame,
+    return _render_thumbnail(
+        style,
+        source_frame,
+        metadata.title,
+        metadata.description,
+        output_path,
+        settings,
+    )
+
+
+def generate_thumbnails(
+    items: list[tuple[AnalysisResult, VideoMetadata, Path]],
+    style: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> list[ThumbnailResult]:
+    """Generate thumbnails for several videos in parallel processes.
+
+    Frames are selected here; only paths and strings are sent to the
+    workers, not the full analysis.
+
+    Args:
+        items: (analysis, metadata, output_path) per video
+        style: Thumbnail style (mrbeast, minimal, ai). Uses config if None.
+        max_workers: Worker processes (defaults to CPU count)
+
+    Returns:
+        ThumbnailResults in the same order as items
+    """
+    settings = get_settings()
+
+    style = style or settings.thumbnail_style
+
+    jobs = [
+        (
+            style,
+            get_best_frame(analysis.frames, metadata.suggested_thumbnail_index),
             metadata.title,
             metadata.description,
             output_path,
+            settings,
         )
+        for analysis, metadata, output_path in items
+    ]
+
+    if len(jobs) <= 1:
+        return [_render_thumbnail(*job) for job in jobs]
+
+    max_workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_render_thumbnail, *zip(*jobs)))
+
+
+def _render_thumbnail(
+    style: str,
+    source_frame: Path,
+    title: str,
+    description: str,
+    output_path: Path,
+    settings: Optional[Settings] = None,
+) -> ThumbnailResult:
+    """Render one thumbnail in the given style. Top-level so it can be pickled.
+
+    Local styles are cached on disk by source frame, title and style. The
+    "ai" style is not - its Gemini suggestions are cached instead, and a
+    fallback render after a failed request must not stick.
+    """
+    cached = None
+    if style != "ai":
+        cached = _thumbnail_cache_path(source_frame, title, style)
+        if _is_fresh(cached, THUMBNAIL_CACHE_TTL):
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(cached, output_path)
+            return ThumbnailResult(path=output_path, source_frame=source_frame, style=style)
+
+    if style == "ai":
+        create_ai_thumbnail_gemini(source_frame, title, description, output_path, settings)
     elif style == "mrbeast":
-        create_mrbeast_thumbnail(source_frame, metadata.title, output_path)
+        create_mrbeast_thumbnail(source_frame, title, output_path)
     elif style == "minimal":
         create_minimal_thumbnail(source_frame, output_path)
     else:
         # Default to mrbeast
-        create_mrbeast_thumbnail(source_frame, metadata.title, output_path)
+        create_mrbeast_thumbnail(source_frame, title, output_path)
+
+    if cached is not None:
+        tmp_path = cached.with_suffix(".tmp")
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, tmp_path)
+            os.replace(tmp_path, cached)
+        except OSError:
+            pass
+        _prune_cache(cached.parent, THUMBNAIL_CACHE_TTL)
 
     return ThumbnailResult(
         path=output_path,
@@ -1,14 +1,23 @@
 """YouTube upload functionality."""
 
 import json
-import pickle
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
-from .config import get_config_dir, get_settings
+from .config import Settings, get_config_dir, get_settings
 from .metadata import VideoMetadata
 
+# Built YouTube clients, one per thread (httplib2 is not thread-safe)
+_youtube_local = threading.local()
+
+# Videos smaller than this are uploaded in a single request
+SINGLE_REQUEST_LIMIT = 64 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 64 * 1024 * 1024
+# Smaller chunks used when retrying after server errors
+FALLBACK_CHUNK_SIZE = 10 * 1024 * 1024
+
 
 @dataclass
 class UploadResult:
@@ -21,7 +30,14 @@ class UploadResult:
 
 
 def get_youtube_service():
-    """Get authenticated YouTube API service."""
+    """Get authenticated YouTube API service.
+
+    The built client is reused until its credentials expire.
+    """
+    service = getattr(_youtube_local, "service", None)
+    if service is not None and _youtube_local.credentials.valid:
+        return service
+
     try:
         from google.oauth2.credentials import Credentials
         from google_auth_oauthlib.flow import InstalledAppFlow
@@ -33,7 +49,8 @@ def get_youtube_service():
         )
 
     config_dir = get_config_dir()
-    token_file = config_dir / "youtube_token.pickle"
+    token_file = config_dir / "youtube_token.json"
+    legacy_token_file = config_dir / "youtube_token.pickle"
     secrets_file = config_dir / "client_secrets.json"
 
     SCOPES = [
@@ -45,8 +62,14 @@ def get_youtube_service():
 
     # Load existing token
     if token_file.exists():
-        with open(token_file, "rb") as f:
+        credentials = Credentials.from_authorized_user_file(str(token_file), SCOPES)
+    elif legacy_token_file.exists():
+        # One-time migration from the old pickled token
+        import pickle
+        with open(legacy_token_file, "rb") as f:
             credentials = pickle.load(f)
+        token_file.write_text(credentials.to_json())
+        legacy_token_file.unlink()
 
     # Refresh or get new token
     if not credentials or not credentials.valid:
@@ -67,10 +90,50 @@ def get_youtube_service():
             credentials = flow.run_local_server(port=8080)
 
         # Save token
-        with open(token_file, "wb") as f:
-            pickle.dump(credentials, f)
+        token_file.write_text(credentials.to_json())
+
+    service = build(
+        "youtube",
+        "v3",
+        credentials=credentials,
+        cache_discovery=False,
+        static_discovery=True,
+    )
+    _youtube_local.service = service
+    _youtube_local.credentials = credentials
+
+    return service
+
+
+def _upload_resumable(youtube, body: dict, video_path: Path, chunksize: int) -> dict:
+    """Upload a video in resumable chunks, returning the API response."""
+    from googleapiclient.http import MediaFileUpload
+
+    media = MediaFileUpload(
+        str(video_path),
+        mimetype="video/*",
+        resumable=True,
+        chunksize=chunksize,
+    )
+
+    request = youtube.videos().insert(
+        part="snippet,status",
+        body=body,
+        media_body=media,
+    )
+
+    response = None
+    last_progress = -1
+    while response is None:
+        status, response = request.next_chunk()
+        if status:
+            progress = int(status.progress() * 100)
+            # Only report when the percentage actually changes
+            if progress != last_progress:
+                print(f"Upload progress: {progress}%")
+                last_progress = progress
 
-    return build("youtube", "v3", credentials=credentials)
+    return response
 
 
 def upload_video(
@@ -79,6 +142,7 @@ def upload_video(
     thumbnail_path: Optional[Path] = None,
     privacy: Optional[str] = None,
     notify_subscribers: bool = False,
+    settings: Optional[Settings] = None,
 ) -> UploadResult:
     """Upload a video to YouTube.
 
@@ -88,16 +152,18 @@ def upload_video(
         thumbnail_path: Path to custom thumbnail image
         privacy: Privacy status (private, unlisted, public). Uses config default if None.
         notify_subscribers: Whether to notify channel subscribers
+        settings: Settings to use. Uses the global settings if None.
 
     Returns:
         UploadResult with video ID and URL
     """
     try:
+        from googleapiclient.errors import HttpError
         from googleapiclient.http import MediaFileUpload
     except ImportError:
         raise ImportError("googleapiclient not installed")
 
-    settings = get_settings()
+    settings = settings or get_settings()
     privacy = privacy or settings.default_privacy
 
     youtube = get_youtube_service()
@@ -118,25 +184,22 @@ def upload_video(
     }
 
     # Upload video
-    media = MediaFileUpload(
-        str(video_path),
-        mimetype="video/*",
-        resumable=True,
-        chunksize=1024 * 1024 * 10,  # 10MB chunks
-    )
-
-    request = youtube.videos().insert(
-        part="snippet,status",
-        body=body,
-        media_body=media,
-    )
-
-    response = None
-    while response is None:
-        status, response = request.next_chunk()
-        if status:
-            progress = int(status.progress() * 100)
-            print(f"Upload progress: {progress}%")
+    size = video_path.stat().st_size
+    try:
+        if size < SINGLE_REQUEST_LIMIT:
+            media = MediaFileUpload(str(video_path), mimetype="video/*", resumable=False)
+            response = youtube.videos().insert(
+                part="snippet,status",
+                body=body,
+                media_body=media,
+            ).execute()
+        else:
+            response = _upload_resumable(youtube, body, video_path, UPLOAD_CHUNK_SIZE)
+    except HttpError as e:
+        if e.resp.status < 500:
+            raise
+        print(f"Upload failed ({e.resp.status}), retrying in smaller chunks")
+        response = _upload_resumable(youtube, body, video_path, FALLBACK_CHUNK_SIZE)
 
     video_id = response["id"]
 
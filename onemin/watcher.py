@@ -1,6 +1,9 @@
 """Folder watcher for automatic video detection."""
 
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -9,6 +12,11 @@ from watchdog.events import FileSystemEventHandler, FileCreatedEvent
 
 from .config import get_settings
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 
 VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".webm", ".m4v"}
 
@@ -20,10 +28,13 @@ class VideoHandler(FileSystemEventHandler):
         self,
         callback: Callable[[Path], None],
         extensions: Optional[set[str]] = None,
+        max_workers: int = 2,
     ):
         self.callback = callback
         self.extensions = extensions or VIDEO_EXTENSIONS
         self._processing: set[str] = set()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
 
     def on_created(self, event: FileCreatedEvent) -> None:
         """Handle file creation events."""
@@ -36,56 +47,104 @@ class VideoHandler(FileSystemEventHandler):
             return
 
         # Avoid processing the same file multiple times
-        if str(path) in self._processing:
-            return
+        with self._lock:
+            if str(path) in self._processing:
+                return
+            self._processing.add(str(path))
 
-        # Wait a bit for the file to finish copying
-        self._wait_for_file_ready(path)
+        # Process off the watchdog thread so videos arriving together overlap
+        self._pool.submit(self._run, path)
 
-        if not path.exists():
-            return
+    def _run(self, path: Path) -> None:
+        """Wait for a new video to finish copying, then process it."""
+        try:
+            # Wait a bit for the file to finish copying
+            self._wait_for_file_ready(path)
 
-        self._processing.add(str(path))
+            if not path.exists():
+                return
 
-        try:
             print(f"New video detected: {path.name}")
             self.callback(path)
+        except Exception as e:
+            print(f"Failed to process {path.name}: {e}")
         finally:
-            self._processing.discard(str(path))
+            with self._lock:
+                self._processing.discard(str(path))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting videos and wait for in-flight ones to finish."""
+        self._pool.shutdown(wait=wait)
 
     def _wait_for_file_ready(
         self,
         path: Path,
         timeout: int = 300,
-        check_interval: int = 2,
+        max_interval: float = 2.0,
     ) -> bool:
         """Wait for a file to finish being written.
 
-        Checks if file size is stable over time.
+        The file counts as ready once its size has stayed unchanged for
+        max_interval seconds and no writer holds a lock on it. A file not
+        modified within the last max_interval seconds is ready immediately.
+        Polling backs off from 100ms up to max_interval.
         """
         start_time = time.time()
         last_size = -1
+        stable_since = start_time
+        interval = 0.1
 
         while time.time() - start_time < timeout:
             if not path.exists():
                 return False
 
-            current_size = path.stat().st_size
+            st = path.stat()
+            now = time.time()
 
-            if current_size == last_size and current_size > 0:
-                # Size hasn't changed, file is ready
+            if st.st_size != last_size:
+                # Still growing (or first check) - restart the stability window
+                last_size = st.st_size
+                stable_since = now
+
+            settled = (
+                now - st.st_mtime >= max_interval
+                or now - stable_since >= max_interval
+            )
+            if st.st_size > 0 and settled and not _is_locked(path):
                 return True
 
-            last_size = current_size
-            time.sleep(check_interval)
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+
+        return False
+
 
+def _is_locked(path: Path) -> bool:
+    """Check whether another process holds an exclusive lock on the file."""
+    if fcntl is None:
         return False
 
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return True
+
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+    except OSError:
+        return True
+    finally:
+        # Closing the descriptor also releases our lock
+        os.close(fd)
+
+    return False
+
 
 def watch_folder(
     callback: Callable[[Path], None],
     folder: Optional[Path] = None,
     blocking: bool = True,
+    max_workers: int = 2,
 ) -> Optional[Observer]:
     """Watch a folder for new video files.
 
@@ -93,6 +152,7 @@ def watch_folder(
         callback: Function to call when a new video is detected
         folder: Folder to watch. Uses config watch_folder if None.
         blocking: If True, blocks until interrupted. If False, returns observer.
+        max_workers: Maximum number of videos processed concurrently
 
     Returns:
         Observer instance if blocking=False, None otherwise
@@ -104,7 +164,7 @@ def watch_folder(
         print(f"Creating watch folder: {watch_path}")
         watch_path.mkdir(parents=True, exist_ok=True)
 
-    handler = VideoHandler(callback)
+    handler = VideoHandler(callback, max_workers=max_workers)
     observer = Observer()
     observer.schedule(handler, str(watch_path), recursive=False)
     observer.start()
@@ -120,11 +180,32 @@ def watch_folder(
             observer.stop()
             print("\nStopped watching")
         observer.join()
+        handler.shutdown()
         return None
     else:
         return observer
 
 
+def find_existing_videos(folder: Optional[Path] = None) -> list[Path]:
+    """Find videos already in the watch folder, oldest first."""
+    settings = get_settings()
+    watch_path = Path(folder) if folder else Path(settings.watch_folder).expanduser()
+
+    if not watch_path.exists():
+        return []
+
+    # Single directory pass
+    with os.scandir(watch_path) as entries:
+        videos = [
+            entry
+            for entry in entries
+            if entry.is_file() and Path(entry.name).suffix.lower() in VIDEO_EXTENSIONS
+        ]
+    videos.sort(key=lambda entry: entry.stat().st_mtime)
+
+    return [Path(entry.path) for entry in videos]
+
+
 def process_existing_videos(
     callback: Callable[[Path], None],
     folder: Optional[Path] = None,
@@ -133,17 +214,10 @@ def process_existing_videos(
 
     Returns the number of videos processed.
     """
-    settings = get_settings()
-    watch_path = Path(folder) if folder else Path(settings.watch_folder).expanduser()
-
-    if not watch_path.exists():
-        return 0
+    videos = find_existing_videos(folder)
 
-    count = 0
-    for ext in VIDEO_EXTENSIONS:
-        for video in watch_path.glob(f"*{ext}"):
-            print(f"Found existing video: {video.name}")
-            callback(video)
-            count += 1
+    for video in videos:
+        print(f"Found existing video: {video.name}")
+        callback(video)
 
-    return count
+    return len(videos)